@@ -0,0 +1,73 @@
+"""
+Memory benchmark: in-memory A* vs external-memory A* (packed states + frontier spill).
+
+For each N and each in-RAM frontier size, solves with both modes and reports the peak
+traced Python memory (tracemalloc) and the bytes per stored state, i.e. peak / max_memory.
+The ratio tells how much larger a search fits in the same RAM.
+
+tracemalloc cannot see mmap allocations: with --backing mmap the explored table bytes
+are added to the external-memory peak, so both backings are compared on the same footing.
+The first default frontier size is the one the nqueens CLI ships with.
+
+USAGE (from the repository root or from experiments/)
+    python experiments/bench_external_memory.py
+    python experiments/bench_external_memory.py --n 6 7 8 --heuristic 1 --frontier 100000 20000
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.nqueens import NQueensProblem
+from src.astar_solver import AStarSolver
+from src.external_memory import ExternalMemoryConfig
+
+
+def measure(n, heuristic_code, external_memory):
+    tracemalloc.start()
+    solver = AStarSolver(NQueensProblem(n), heuristic_code=heuristic_code, external_memory=external_memory)
+    solution = solver.solve()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return solution, peak, solver.metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="In-memory vs external-memory A* peak memory.")
+    parser.add_argument("--n", type=int, nargs="+", default=[6, 7, 8])
+    parser.add_argument("--heuristic", default="1")
+    parser.add_argument("--frontier", type=int, nargs="+",
+                        default=[ExternalMemoryConfig().max_frontier_in_memory, 20_000],
+                        help="frontier entries kept in RAM, one row per value")
+    parser.add_argument("--backing", choices=["memory", "mmap"], default="memory")
+    parser.add_argument("--spill-dir", default=None)
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>3} {'FRONTIER':>9} {'STATES':>9} {'RAM PEAK':>12} {'B/STATE':>8} {'EXT PEAK':>12} {'B/STATE':>8} "
+          f"{'TABLE B/STATE':>13} {'RATIO':>6} {'TIME x':>7}")
+
+    for n in args.n:
+        solution_ram, peak_ram, metrics_ram = measure(n, args.heuristic, None)
+        states = max(1, metrics_ram["max_memory"])
+
+        for frontier in args.frontier:
+            config = ExternalMemoryConfig(max_frontier_in_memory=frontier,
+                                          explored_backing=args.backing,
+                                          spill_dir=args.spill_dir)
+            solution_ext, peak_ext, metrics_ext = measure(n, args.heuristic, config)
+            assert solution_ram == solution_ext, "external-memory mode must find the same solution"
+
+            if args.backing == "mmap":
+                peak_ext += metrics_ext["explored_bytes"]
+
+            print(f"{n:>3} {frontier:>9} {states:>9} {peak_ram:>12} {peak_ram / states:>8.1f} {peak_ext:>12} "
+                  f"{peak_ext / states:>8.1f} {metrics_ext['explored_bytes_per_state']:>13.1f} "
+                  f"{peak_ram / max(1, peak_ext):>6.1f} "
+                  f"{metrics_ext['time_taken'] / max(1e-9, metrics_ram['time_taken']):>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Cold start benchmark for the nqueens CLI.
+
+Runs one-shot solves through `python -X importtime nqueens.py ...`, sums the
+per-module import times reported by the interpreter and checks that heavy
+modules are never imported by engines that don't need them.
+Exits with a non-zero status on regressions, so it can be used as a gate.
+
+USAGE (from the repository root or from experiments/)
+    python experiments/bench_startup.py
+    python experiments/bench_startup.py --budget-ms 80 --repeats 10
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_SCRIPT = os.path.join(ROOT_DIR, "nqueens.py")
+
+#modules that must NOT be loaded at start-up for a given engine
+HEAVY_MODULES = ["constraint", "pandas", "matplotlib", "numpy"]
+
+CASES = [
+    #(label, cli args, modules allowed for this case)
+    ("help", ["--help"], []),
+    ("astar", ["6", "--engine", "astar"], []),
+    ("csp", ["6", "--engine", "csp"], ["constraint"]),
+    ("bitmask", ["6", "--engine", "bitmask"], []),
+    ("astar-em", ["6", "--engine", "astar", "--external-memory"], []),
+]
+
+#"import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$")
+
+
+def measure(cli_args):
+    """
+    runs the CLI once with -X importtime
+    returns (total self import time in microseconds, set of top level modules imported)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", CLI_SCRIPT, *cli_args],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"nqueens {' '.join(cli_args)} failed: {result.stderr.strip()[-500:]}")
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        total_us += int(match.group(1))
+        modules.add(match.group(3).strip().split(".")[0])
+
+    return total_us, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold start (import time) benchmark for the nqueens CLI.")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per case, the best one is kept")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if the best import time of the no-heavy-deps cases exceeds this")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'CASE':<8} {'BEST IMPORT TIME (ms)':>22}  MODULES")
+
+    for label, cli_args, allowed in CASES:
+        best_us = None
+        modules = set()
+        for _ in range(args.repeats):
+            total_us, modules = measure(cli_args)
+            if best_us is None or total_us < best_us:
+                best_us = total_us
+
+        print(f"{label:<8} {best_us / 1000:>22.3f}  {len(modules)}")
+
+        leaked = [m for m in HEAVY_MODULES if m in modules and m not in allowed]
+        if leaked:
+            failed = True
+            print(f"  [!] REGRESSION: heavy modules imported at start-up: {', '.join(leaked)}")
+
+        if args.budget_ms is not None and not allowed and best_us / 1000 > args.budget_ms:
+            failed = True
+            print(f"  [!] REGRESSION: {best_us / 1000:.3f} ms exceeds the {args.budget_ms} ms budget")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Variants benchmark: standard board vs toroidal, rectangular and superqueens boards.
+
+All variants share the attack-line core of NQueensProblem, so their per node cost
+should stay close to the standard board, toroidal boards included (couples sharing
+several attack lines are corrected from a precomputed table, like the knight checks).
+Search spaces differ, per node costs mostly don't: superqueens pay for the knight checks,
+and per node bitmask times include the mask precomputation, spread over fewer nodes
+on the variants:
+
+    - core:    A* inner loop (get_successors + child_conflicts) on random partial states,
+               reported as microseconds per generated child
+    - bitmask: full BitmaskSolver solve, microseconds per placed queen
+    - csp:     full CSPSolver solve (pairwise_diagonal encoding), seconds
+
+Every measurement loops until it has run for at least --min-ms milliseconds (a single
+bitmask solve takes microseconds, far below timer noise), is repeated --repeats times
+and the best one is kept. Repeats go round the variants, so machine load drifts
+hit all of them alike.
+
+USAGE (from the repository root or from experiments/)
+    python experiments/bench_variants.py
+    python experiments/bench_variants.py --n 16 --bitmask-n 13 --csp-n 11 --repeats 7
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.nqueens import NQueensProblem
+from src.bitmask_solver import BitmaskSolver
+
+
+def variants(n):
+    return {
+        "standard": NQueensProblem(n),
+        "toroidal": NQueensProblem(n, toroidal=True),
+        "rectangular": NQueensProblem(n, n_rows=n + 2),
+        "superqueens": NQueensProblem(n, knight_moves=True),
+    }
+
+
+def seconds_per_call(function, min_ms):
+    """
+    calls function until at least min_ms milliseconds have passed
+    returns (seconds per call, last return value)
+    """
+    calls = 0
+    result = None
+    start = time.perf_counter()
+    while True:
+        result = function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed * 1000 >= min_ms:
+            return elapsed / calls, result
+
+
+def bench_core(problem, samples, min_ms, seed=0):
+    rng = random.Random(seed)
+    states = [tuple(rng.randrange(problem.n_rows) for _ in range(rng.randrange(problem.n)))
+              for _ in range(samples)]
+
+    def run():
+        children = 0
+        for state in states:
+            problem.get_successors(state)
+            children += len(problem.child_conflicts(state))
+        return children
+
+    elapsed, children = seconds_per_call(run, min_ms)
+    return 1e6 * elapsed / children
+
+
+def bench_bitmask(problem, min_ms):
+    def run():
+        solver = BitmaskSolver(problem)
+        solver.solve()
+        return max(1, solver.metrics["nodes_expanded"])
+
+    elapsed, nodes = seconds_per_call(run, min_ms)
+    return 1e6 * elapsed / nodes, nodes
+
+
+def bench_csp(problem, min_ms):
+    from src.csp_solver import CSPSolver
+
+    return seconds_per_call(lambda: CSPSolver(problem.n, board=problem).solve(), min_ms)[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per node cost of the board variants.")
+    parser.add_argument("--n", type=int, default=16, help="board size for the core benchmark")
+    parser.add_argument("--samples", type=int, default=2000, help="random partial states for the core benchmark")
+    parser.add_argument("--bitmask-n", type=int, default=13, help="board size for the bitmask solves (13: every variant solvable)")
+    parser.add_argument("--csp-n", type=int, default=11, help="board size for the CSP solves (0 to skip)")
+    parser.add_argument("--repeats", type=int, default=5, help="measurements per variant, the best one is kept")
+    parser.add_argument("--min-ms", type=float, default=50, help="minimum duration of a single measurement")
+    args = parser.parse_args(argv)
+
+    core_boards = variants(args.n)
+    bitmask_boards = variants(args.bitmask_n)
+    csp_boards = variants(args.csp_n) if args.csp_n else {}
+
+    #name -> [best core, best bitmask, nodes, best csp]
+    best = {name: [float("inf"), float("inf"), 0, float("inf")] for name in core_boards}
+    for _ in range(args.repeats):
+        for name, problem in core_boards.items():
+            acc = best[name]
+            acc[0] = min(acc[0], bench_core(problem, args.samples, args.min_ms))
+            bitmask, acc[2] = bench_bitmask(bitmask_boards[name], args.min_ms)
+            acc[1] = min(acc[1], bitmask)
+            if csp_boards:
+                acc[3] = min(acc[3], bench_csp(csp_boards[name], args.min_ms))
+
+    print(f"{'VARIANT':<12} {'CORE us/child':>14} {'x STD':>6} {'BITMASK us/node':>16} {'x STD':>6} "
+          f"{'NODES':>7} {'CSP sec':>9}")
+
+    core_baseline, bitmask_baseline = best["standard"][0], best["standard"][1]
+    for name, (core, bitmask, nodes, csp) in best.items():
+        csp = f"{csp:>9.4f}" if csp_boards else f"{'-':>9}"
+        print(f"{name:<12} {core:>14.3f} {core / core_baseline:>6.2f} {bitmask:>16.3f} "
+              f"{bitmask / bitmask_baseline:>6.2f} {nodes:>7} {csp}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,229 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import argparse
+import csv
+import json
+import os
 import pathlib
+import sys
 
-FILE_ASTAR = "astar_results.csv"
-FILE_CSP = "csp_results.csv"
-OUTPUT_DIR = "experiments"
+EXPERIMENTS_DIR = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(EXPERIMENTS_DIR.parent))
 
-def main():
-    
-    df_astar = pd.read_csv(FILE_ASTAR)
-    df_csp = pd.read_csv(FILE_CSP)
+from src.results_sink import (COLUMNAR_FORMATS, columnar_available, iter_part_files, read_generation, read_part_rows,
+                              resolve_path)
+
+FILE_ASTAR = EXPERIMENTS_DIR / "astar_results.csv"
+FILE_CSP = EXPERIMENTS_DIR / "csp_results.csv"
+OUTPUT_DIR = EXPERIMENTS_DIR
+STATE_FILE = EXPERIMENTS_DIR / "report_state.json"
+
+# ---------------------------------------------------------------------
+# Incremental aggregation
+#
+# Results files are append-only, so the report never reloads them:
+# report_state.json remembers, per results file, how far it has been read
+# (byte offset for CSV, part files for parquet / arrow) together with the
+# running aggregates, and each run only folds in the rows appended since.
+# A results file rewritten from scratch (runner without --resume) is detected
+# through the first and last consumed CSV lines, or the columnar generation id,
+# and its aggregates are rebuilt; a results file that no longer exists is dropped.
+#
+# Only the file of the chosen format is plotted (the one the runners write with the
+# same --format): a CSV left next to a parquet directory is not a repeat run.
+#
+# AGGREGATES: series -> N -> [count, time_sum, nodes_expanded_sum]
+# (count > 1 when the same configuration has been run more than once)
+# ---------------------------------------------------------------------
+
+SOURCES = {
+    #name: (base path, column naming the series)
+    "astar": (FILE_ASTAR, "HEURISTIC"),
+    "csp": (FILE_CSP, "ENCODING"),
+}
+
+
+def load_state():
+    if STATE_FILE.exists():
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    tmp_path = str(STATE_FILE) + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def fold_row(aggregates, row, series_column):
+    series = aggregates.setdefault(str(row[series_column]), {})
+    acc = series.setdefault(str(int(row["N"])), [0, 0.0, 0.0])
+    acc[0] += 1
+    acc[1] += float(row["TIME_TAKEN"])
+    acc[2] += float(row.get("NODES_EXPANDED") or 0)
+
+
+def _csv_prefix_unchanged(f, source_state, header_line):
+    """
+    True if the file still starts with the lines consumed so far:
+    same header, same first data line, same last consumed line at the same offset
+    """
+    offset = source_state.get("offset", 0)
+    first_line = source_state.get("first_line", "").encode()
+    last_line = source_state.get("last_line", "").encode()
+
+    if source_state.get("header_line") != header_line.decode() or offset > os.fstat(f.fileno()).st_size:
+        return False
+
+    f.seek(len(header_line))
+    if first_line and f.read(len(first_line)) != first_line:
+        return False
+
+    f.seek(offset - len(last_line))
+    return f.read(len(last_line)) == last_line
+
+
+def update_from_csv(source_state, path, series_column):
+    """
+    folds in the complete lines appended after the stored offset
+    a rewritten file (see _csv_prefix_unchanged) is read again from the start
+    """
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode()]), [])
+
+        if not _csv_prefix_unchanged(f, source_state, header_line):
+            source_state.clear()
+            source_state.update({"header_line": header_line.decode(), "offset": len(header_line),
+                                 "first_line": "", "last_line": "", "aggregates": {}})
+
+        f.seek(source_state["offset"])
+        aggregates = source_state["aggregates"]
+
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # row still being written, picked up next time
+            source_state["offset"] += len(line)
+            source_state["last_line"] = line.decode()
+            if not source_state["first_line"]:
+                source_state["first_line"] = line.decode()
+
+            values = next(csv.reader([line.decode()]), None)
+            if not values or len(values) != len(header):
+                continue
+            fold_row(aggregates, dict(zip(header, values)), series_column)
+
+
+def update_from_parts(source_state, path, series_column):
+    """
+    folds in the part files not seen yet
+    a different generation id, or a missing known part, means the results have been rewritten
+    """
+    parts = iter_part_files(path)
+    names = [os.path.basename(part) for part in parts]
+    generation = read_generation(path)
+
+    if source_state.get("generation") != generation or not set(source_state.get("parts", [])) <= set(names):
+        source_state.clear()
+    source_state["generation"] = generation
+    source_state.setdefault("parts", [])
+    source_state.setdefault("aggregates", {})
+
+    for part, name in zip(parts, names):
+        if name in source_state["parts"]:
+            continue
+        for row in read_part_rows(part):
+            fold_row(source_state["aggregates"], row, series_column)
+        source_state["parts"].append(name)
+
+
+def source_paths(name):
+    """
+    every results file a source can have on disk: the CSV and one directory per columnar format
+    """
+    csv_path = str(SOURCES[name][0])
+    return [csv_path] + [resolve_path(csv_path, fmt) for fmt in COLUMNAR_FORMATS]
+
+
+def results_path(name, fmt):
+    """
+    results file of a source written by the runners with the given format
+    (columnar formats fall back to CSV without pyarrow, like ResultsSink)
+    """
+    if fmt in COLUMNAR_FORMATS and not columnar_available():
+        fmt = "csv"
+    return resolve_path(str(SOURCES[name][0]), fmt)
+
+
+def update_aggregates(state, fmt="csv"):
+    for name, (_, series_column) in SOURCES.items():
+        for path in source_paths(name):
+            if not os.path.exists(path):
+                state.pop(os.path.basename(path), None)
+
+        path = results_path(name, fmt)
+        if os.path.isfile(path):
+            update_from_csv(state.setdefault(os.path.basename(path), {}), path, series_column)
+        elif os.path.isdir(path):
+            update_from_parts(state.setdefault(os.path.basename(path), {}), path, series_column)
+
+    return state
+
+
+def merged_series(state, name, fmt="csv"):
+    """
+    series -> sorted list of (N, mean time, mean nodes expanded), from the results file of the given format
+    """
+    aggregates = state.get(os.path.basename(results_path(name, fmt)), {}).get("aggregates", {})
+
+    return {
+        series: [(int(n), time_sum / count, nodes_sum / count)
+                 for n, (count, time_sum, nodes_sum) in sorted(per_n.items(), key=lambda item: int(item[0]))]
+        for series, per_n in aggregates.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plots of the A* and CSP experiment results.")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], default="csv",
+                        help="results format the runners were launched with")
+    args = parser.parse_args(argv)
+
+    import matplotlib.pyplot as plt
+
+    state = update_aggregates(load_state(), fmt=args.format)
+    save_state(state)
+
+    astar = merged_series(state, "astar", fmt=args.format)
+    csp = merged_series(state, "csp", fmt=args.format)
 
     plt.style.use('bmh') # looked more stylish
     plt.figure(figsize=(10, 6))
 
-    for heuristic in df_astar['HEURISTIC'].unique():
-        subset = df_astar[df_astar['HEURISTIC'] == heuristic]
-        plt.plot(subset['N'], subset['TIME_TAKEN'], marker='o', label=f'A* - {heuristic}')
-    plt.plot(df_csp['N'], df_csp['TIME_TAKEN'], marker='s', linestyle='--', label='CSP', color='black')
-    
+    for heuristic, points in sorted(astar.items()):
+        plt.plot([p[0] for p in points], [p[1] for p in points], marker='o', label=f'A* - {heuristic}')
+    for encoding, points in sorted(csp.items()):
+        plt.plot([p[0] for p in points], [p[1] for p in points], marker='s', linestyle='--', label=f'CSP - {encoding}')
+
     plt.title('Execution Time: A* vs CSP WITH LOGARITMIC SCALE', fontsize=16)
     plt.xlabel('Scaling parameter -> N (n° of queens and chessboard cells per side)', fontsize=12)
     plt.ylabel('Time (sec)', fontsize=12)
-    plt.yscale('log') 
+    plt.yscale('log')
     plt.legend()
     plt.grid(True, which="both", ls="-", alpha=0.5)
     plt.tight_layout()
 
-    output_path = OUTPUT_DIR + '/plot_time_comparison_log.png'
+    output_path = OUTPUT_DIR / 'plot_time_comparison_log.png'
     plt.savefig(output_path, dpi=300)
     plt.close()
 
-    
+
     #############################################################
     #A* search space
     plt.figure(figsize=(10, 6))
-    
-    for heuristic in df_astar['HEURISTIC'].unique():
-        subset = df_astar[df_astar['HEURISTIC'] == heuristic]
-        plt.plot(subset['N'], subset['NODES_EXPANDED'], marker='o', label=f'A* - {heuristic}')
+
+    for heuristic, points in sorted(astar.items()):
+        plt.plot([p[0] for p in points], [p[2] for p in points], marker='o', label=f'A* - {heuristic}')
 
     plt.title('A* Search Space: Nodes expanded with respect to N', fontsize=16)
     plt.xlabel('N (Number of Queens)', fontsize=12)
@@ -47,25 +232,28 @@ def main():
     plt.legend()
     plt.grid(True, which="both", ls="-", alpha=0.5)
     plt.tight_layout()
-    output_path = OUTPUT_DIR + '/plot_astar_nodes.png'
+    output_path = OUTPUT_DIR / 'plot_astar_nodes.png'
     plt.savefig(output_path, dpi=300)
     plt.close()
 
     ############################################################à
     #CSP time taken vs scaling parameter N
-    plt.plot(df_csp['N'], df_csp['TIME_TAKEN'], marker='s', color='black', label='CSP Solver')
-        
+    plt.figure(figsize=(10, 6))
+
+    for encoding, points in sorted(csp.items()):
+        plt.plot([p[0] for p in points], [p[1] for p in points], marker='s', label=f'CSP - {encoding}')
+
     plt.title('CSP time taken vs N', fontsize=16)
     plt.xlabel('N (Number of Queens)', fontsize=12)
     plt.ylabel('Time (seconds)', fontsize=12)
     plt.axhline(y=180, color='r', linestyle=':', label='A* Timeout Threshold')
-    
+
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    output_path = OUTPUT_DIR + '/plot_csp_time_performances.png'
+    output_path = OUTPUT_DIR / 'plot_csp_time_performances.png'
     plt.savefig(output_path, dpi=300)
     plt.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
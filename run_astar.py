@@ -1,33 +1,42 @@
-import time
-import csv
+import argparse
 import os
 from src.nqueens import NQueensProblem
 from src.astar_solver import AStarSolver
+from src.results_sink import ResultsSink
 
 STARTING_N = 4
 MAX_N = 50
 TIMEOUT_LIMIT_SECONDS = 300
 REPORT_DIR = "experiments"
 CSV_ASTAR = "astar_results.csv"
-
-def run_astar_experiments():
-    os.makedirs(REPORT_DIR, exist_ok=True)
+BATCH_SIZE = 32
+MAX_DELAY_S = 10 #each solve can take up to TIMEOUT_LIMIT_SECONDS: don't sit on finished rows
+
+ASTAR_COLUMNS = [
+    "ALG",
+    "HEURISTIC",
+    "N",
+    "TIME_TAKEN",
+    "NODES_EXPANDED",
+    "NODES_GENERATED",
+    "MAX_MEMORY",
+    "SOLUTION_COST",
+    "BRANCHING_FACTOR",
+]
+ASTAR_KEY = ["ALG", "HEURISTIC", "N"]
+ASTAR_CSV_FORMATS = {
+    "TIME_TAKEN": "{:.12f}",
+    "BRANCHING_FACTOR": "{:.12f}",
+}
+
+def run_astar_experiments(fmt="csv", resume=False, batch_size=BATCH_SIZE, max_delay_s=MAX_DELAY_S):
     path_astar = os.path.join(REPORT_DIR, CSV_ASTAR)
 
-    with open(path_astar, mode="w", newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "ALG",
-            "HEURISTIC",
-            "N",
-            "TIME_TAKEN",
-            "NODES_EXPANDED",
-            "NODES_GENERATED",
-            "MAX_MEMORY",
-            "SOLUTION_COST",
-            "BRANCHING_FACTOR",
-        ])
+    with ResultsSink(path_astar, ASTAR_COLUMNS, ASTAR_KEY, fmt=fmt, batch_size=batch_size, max_delay_s=max_delay_s,
+                     resume=resume, csv_formats=ASTAR_CSV_FORMATS) as sink:
+        _run_astar_sweep(sink)
 
+def _run_astar_sweep(sink):
     # Status tracking for A* heuristics
     active_status = {
         "A*_h0": False,
@@ -48,7 +57,14 @@ def run_astar_experiments():
         for h_code, h_name in [("0", "h0"), ("1", "h1"), ("2", "h2")]:
             alg_key = f"A*_{h_name}"
 
-            if active_status[alg_key]:
+            if active_status[alg_key] and sink.is_done(("A*", h_name, n)):
+                #RESUME: already on disk, only restore the timeout status
+                previous = sink.completed_row(("A*", h_name, n))
+                print(f"PROGRESS: A* {h_name} already done for N = {n}, skipping")
+                if float(previous["TIME_TAKEN"]) >= TIMEOUT_LIMIT_SECONDS:
+                    active_status[alg_key] = False
+
+            elif active_status[alg_key]:
                 print(f"PROGRESS: solving with A*, heuristic: {h_name}", end="", flush=True)
 
                 try:
@@ -61,7 +77,7 @@ def run_astar_experiments():
 
                     print(f"\n  PROGRESS: DONE IN {time_taken:.12f} seconds. | NODES EXPANDED: {metrics['nodes_expanded']}")
 
-                    save_row_astar(path_astar, "A*", h_name, n, metrics)
+                    save_row_astar(sink, "A*", h_name, n, metrics)
 
                     if time_taken >= TIMEOUT_LIMIT_SECONDS:
                         active_status[alg_key] = False
@@ -76,20 +92,29 @@ def run_astar_experiments():
 
     print("[END] PROGRESS: ALL A* EXPERIMENTS HAVE BEEN DONE.\n")
 
-def save_row_astar(path, alg, heuristic, n, metrics):
-    with open(path, mode="a", newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            alg,
-            heuristic,
-            n,
-            f"{metrics['time_taken']:.12f}",
-            metrics["nodes_expanded"],
-            metrics["nodes_generated"],
-            metrics["max_memory"],
-            metrics["solution_cost"],
-            f"{metrics['branching_factor']:.12f}",
-        ])
+def save_row_astar(sink, alg, heuristic, n, metrics):
+    sink.write({
+        "ALG": alg,
+        "HEURISTIC": heuristic,
+        "N": n,
+        "TIME_TAKEN": metrics["time_taken"],
+        "NODES_EXPANDED": metrics["nodes_expanded"],
+        "NODES_GENERATED": metrics["nodes_generated"],
+        "MAX_MEMORY": metrics["max_memory"],
+        "SOLUTION_COST": metrics["solution_cost"],
+        "BRANCHING_FACTOR": metrics["branching_factor"],
+    })
 
 if __name__ == "__main__":
-    run_astar_experiments()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="A* experiments sweep over N.")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], default="csv",
+                        help="results format (columnar formats need pyarrow, CSV fallback otherwise)")
+    parser.add_argument("--resume", action="store_true",
+                        help="keep existing results and skip the (heuristic, N) runs already done")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows buffered before writing")
+    parser.add_argument("--max-delay-s", type=float, default=MAX_DELAY_S,
+                        help="seconds after the last flush past which buffered rows are written anyway")
+    args = parser.parse_args()
+
+    run_astar_experiments(fmt=args.format, resume=args.resume, batch_size=args.batch_size,
+                          max_delay_s=args.max_delay_s)
\ No newline at end of file
@@ -1,31 +1,39 @@
-import time
-import csv
+import argparse
 import os
 from src.csp_solver import CSPSolver, CSPConfig
+from src.results_sink import ResultsSink
 
 STARTING_N = 4
 MAX_N = 50
 TIMEOUT_LIMIT_SECONDS = 300
 REPORT_DIR = "experiments"
 CSV_CSP = "csp_results.csv"
-
-def run_csp_experiments():
-    os.makedirs(REPORT_DIR, exist_ok=True)
+BATCH_SIZE = 32
+MAX_DELAY_S = 10 #each solve can take up to TIMEOUT_LIMIT_SECONDS: don't sit on finished rows
+
+CSP_COLUMNS = [
+    "ALG",
+    "N",
+    "ENCODING",
+    "TIME_TAKEN",
+    "VARIABLES",
+    "CONSTRAINTS",
+    "SOLVER_CALLS",
+    "SOLUTIONS_FOUND"
+]
+CSP_KEY = ["ALG", "ENCODING", "N"]
+CSP_CSV_FORMATS = {
+    "TIME_TAKEN": "{:.8f}",
+}
+
+def run_csp_experiments(fmt="csv", resume=False, batch_size=BATCH_SIZE, max_delay_s=MAX_DELAY_S):
     path_csp = os.path.join(REPORT_DIR, CSV_CSP)
 
-    with open(path_csp, mode="w", newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "ALG",
-            "N",
-            "ENCODING",
-            "TIME_TAKEN",
-            "VARIABLES",
-            "CONSTRAINTS",
-            "SOLVER_CALLS",
-            "SOLUTIONS_FOUND"
-        ])
-    
+    with ResultsSink(path_csp, CSP_COLUMNS, CSP_KEY, fmt=fmt, batch_size=batch_size, max_delay_s=max_delay_s,
+                     resume=resume, csv_formats=CSP_CSV_FORMATS) as sink:
+        _run_csp_sweep(sink)
+
+def _run_csp_sweep(sink):
     active_status = {
         "pairwise_diagonal": True,
         "alldiff_diagonals": True,
@@ -48,6 +56,14 @@ def run_csp_experiments():
             if not active_status[encoding]: #SKIP IF DISABLED!
                 continue
 
+            if sink.is_done(("CSP", encoding, n)):
+                #RESUME: already on disk, only restore the timeout status
+                previous = sink.completed_row(("CSP", encoding, n))
+                print(f"PROGRESS: {encoding} already done for N = {n}, skipping")
+                if float(previous["TIME_TAKEN"]) >= TIMEOUT_LIMIT_SECONDS:
+                    active_status[encoding] = False
+                continue
+
             print(f"PROGRESS: solving {encoding} encoding", end="", flush=True)
 
             try:
@@ -62,7 +78,7 @@ def run_csp_experiments():
                 constr_count = metrics.get('constraints_count', 'N/A')
 
                 print(f"\n    DONE IN {time_taken:.4f} sec. | Vars: {vars_count} | Constr: {constr_count}")
-                save_row_csp(path_csp, "CSP", n, metrics)
+                save_row_csp(sink, "CSP", n, metrics)
 
                 if time_taken >= TIMEOUT_LIMIT_SECONDS:
                     active_status[encoding] = False
@@ -74,19 +90,28 @@ def run_csp_experiments():
 
     print("\n[END] CSP EXPERIMENT HAS CONCLUDED")
 
-def save_row_csp(path, alg, n, metrics):
-    with open(path, mode="a", newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            alg,
-            n,
-            metrics.get("encoding", "unknown"),
-            f"{metrics['time_taken']:.8f}",
-            metrics.get("variables_count", 0),
-            metrics.get("constraints_count", 0),
-            metrics.get("solver_calls", 0),
-            metrics.get("solutions_found", 0)
-        ])
+def save_row_csp(sink, alg, n, metrics):
+    sink.write({
+        "ALG": alg,
+        "N": n,
+        "ENCODING": metrics.get("encoding", "unknown"),
+        "TIME_TAKEN": metrics["time_taken"],
+        "VARIABLES": metrics.get("variables_count", 0),
+        "CONSTRAINTS": metrics.get("constraints_count", 0),
+        "SOLVER_CALLS": metrics.get("solver_calls", 0),
+        "SOLUTIONS_FOUND": metrics.get("solutions_found", 0)
+    })
 
 if __name__ == "__main__":
-    run_csp_experiments()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CSP experiments sweep over N.")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], default="csv",
+                        help="results format (columnar formats need pyarrow, CSV fallback otherwise)")
+    parser.add_argument("--resume", action="store_true",
+                        help="keep existing results and skip the (encoding, N) runs already done")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows buffered before writing")
+    parser.add_argument("--max-delay-s", type=float, default=MAX_DELAY_S,
+                        help="seconds after the last flush past which buffered rows are written anyway")
+    args = parser.parse_args()
+
+    run_csp_experiments(fmt=args.format, resume=args.resume, batch_size=args.batch_size,
+                        max_delay_s=args.max_delay_s)
\ No newline at end of file
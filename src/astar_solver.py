@@ -1,6 +1,6 @@
 import heapq
 import time
-from src.nqueens import HEURISTICS
+from src.nqueens import HEURISTICS, CHILD_HEURISTICS
 
 class AStarSolver:
     """
@@ -10,16 +10,20 @@ class AStarSolver:
     As planned, it has been made in a way one could apply it with whatever heuristic is wanted
     """
 
-    def __init__(self, problem, heuristic_code="1"):
+    def __init__(self, problem, heuristic_code="1", external_memory=None):
         """
         :param problem: problem instance (in this case it's the N-Queens problem)
         :param heuristic_name: switcher for heuristics (DEFINED IN nqueens.py)
+        :param external_memory: optional ExternalMemoryConfig (DEFINED IN external_memory.py),
+            packs states into fixed width records and spills the frontier tail to disk
         """
         self.problem = problem
+        self.external_memory = external_memory
 
         if heuristic_code not in HEURISTICS:
             raise ValueError(f"Wrong hueristic code")
         self.heuristic_func = HEURISTICS[heuristic_code]
+        self.child_heuristic_func = CHILD_HEURISTICS.get(heuristic_code)
 
         self.metrics = {
             "time_taken": 0.0,
@@ -32,6 +36,9 @@ class AStarSolver:
         }
 
     def solve(self):
+        if self.external_memory is not None:
+            return self._solve_external()
+
         start_time = time.perf_counter()
         
         #INITIALIZATIONS
@@ -67,12 +74,11 @@ class AStarSolver:
                 self._finalize_metrics(start_time, current_g, len(current_state))
                 return current_state
             
-            for action, neighbor, step_cost in self.problem.get_successors(current_state):
+            for (action, neighbor, step_cost), h in self._scored_successors(current_state):
                 if neighbor in explored: #NO REOPENING
                     continue
 
                 new_g = current_g + step_cost
-                h = self.heuristic_func(self.problem, neighbor)
                 new_f = new_g + h
 
                 tie_breaker += 1
@@ -82,6 +88,102 @@ class AStarSolver:
         self._finalize_metrics(start_time, 0, 0)
         return None
     
+    def _solve_external(self):
+        """
+        same search as solve(), with packed states:
+        explored set -> PackedStateSet, frontier -> SpillingFrontier
+        (same (f, tie_breaker) order, so same expansions and same solution)
+        """
+        #imported here to keep the default (in-memory) path light on imports
+        from src.external_memory import StatePacker, PackedStateSet, SpillingFrontier
+
+        start_time = time.perf_counter()
+        config = self.external_memory
+
+        packer = StatePacker(self.problem.n, self.problem.n_rows)
+        explored = PackedStateSet(packer.record_size,
+                                  initial_capacity=config.initial_capacity,
+                                  max_load_factor=config.max_load_factor,
+                                  backing=config.explored_backing,
+                                  spill_dir=config.spill_dir)
+        frontier = SpillingFrontier(packer.record_size,
+                                    max_in_memory=config.max_frontier_in_memory,
+                                    spill_dir=config.spill_dir)
+
+        try:
+            #INITIALIZATIONS
+            tie_breaker = 0
+
+            initial_state = self.problem.get_initial_state()
+            h_start = self.heuristic_func(self.problem, initial_state)
+
+            frontier.push((h_start, tie_breaker, packer.pack(initial_state), 0))
+            self.metrics["nodes_generated"] += 1
+
+            #ACTUAL A* ITERATION
+            while frontier:
+                current_memory = len(frontier) + len(explored)
+                if current_memory > self.metrics["max_memory"]:
+                    self.metrics["max_memory"] = current_memory
+
+                current_f, _, current_record, current_g = frontier.pop()
+
+                #lazy deletion, as in solve()
+                if not explored.add(current_record):
+                    continue
+
+                self.metrics["nodes_expanded"] += 1
+                current_state = packer.unpack(current_record)
+
+                if self.problem.is_goal(current_state):
+                    self._finalize_metrics(start_time, current_g, len(current_state))
+                    self._external_metrics(packer, explored, frontier)
+                    return current_state
+
+                for (action, neighbor, step_cost), h in self._scored_successors(current_state):
+                    neighbor_record = packer.pack(neighbor)
+                    if neighbor_record in explored: #NO REOPENING
+                        continue
+
+                    new_g = current_g + step_cost
+                    new_f = new_g + h
+
+                    tie_breaker += 1
+                    frontier.push((new_f, tie_breaker, neighbor_record, new_g))
+                    self.metrics["nodes_generated"] += 1
+
+            self._finalize_metrics(start_time, 0, 0)
+            self._external_metrics(packer, explored, frontier)
+            return None
+
+        finally:
+            frontier.close()
+            explored.close()
+
+    def _scored_successors(self, state):
+        """
+        (successor, heuristic value) pairs: all the values from one call when the
+        heuristic has a batched version (CHILD_HEURISTICS), child by child otherwise
+        """
+        successors = self.problem.get_successors(state)
+        if self.child_heuristic_func is not None and successors:
+            return zip(successors, self.child_heuristic_func(self.problem, state))
+        return ((successor, self.heuristic_func(self.problem, successor[1])) for successor in successors)
+
+    def _external_metrics(self, packer, explored, frontier):
+        """
+        memory accounting of the external-memory mode
+        bytes_per_state: explored table + frontier peak RAM, per peak stored state (max_memory)
+        """
+        self.metrics["record_size"] = packer.record_size
+        self.metrics["explored_bytes"] = explored.nbytes
+        self.metrics["explored_bytes_per_state"] = explored.bytes_per_state()
+        self.metrics["frontier_bytes"] = frontier.peak_nbytes()
+        self.metrics["bytes_per_state"] = ((explored.nbytes + frontier.peak_nbytes())
+                                           / max(1, self.metrics["max_memory"]))
+        self.metrics["spilled_runs"] = frontier.spilled_runs
+        self.metrics["spilled_states"] = frontier.spilled_entries
+
     def _finalize_metrics(self, start_time, cost, depth):
         """
         saving info for report
@@ -0,0 +1,90 @@
+import time
+
+
+class BitmaskSolver:
+    """
+    Depth first backtracking for N-Queens and its variants (see NQueensProblem).
+
+    Works column by column on the precomputed attack lines of the problem:
+      - every cell has a line mask (one bit per attack line through it, from cell_lines)
+      - the lines already taken by placed queens are a single int, so checking a cell is one AND
+      - knight attacks (superqueens) are kept as per-column masks of forbidden rows
+    No heuristic, no explored set: the cheapest engine when only one solution is needed.
+    """
+
+    def __init__(self, problem):
+        """
+        :param problem: problem instance (NQueensProblem, any variant)
+        """
+        self.problem = problem
+
+        self.metrics = {
+            "time_taken": 0.0,
+            "nodes_expanded": 0,  # queens placed
+            "backtracks": 0,
+            "solution": None,
+        }
+
+    def solve(self):
+        start_time = time.perf_counter()
+        problem = self.problem
+
+        #PRECOMPUTATIONS
+        line_masks = [
+            [sum(1 << line for line in problem.cell_lines[col][row]) for row in range(problem.n_rows)]
+            for col in range(problem.n)
+        ]
+
+        #knight_later[col][row] -> ((later col, row bit), ...): the mirror of knight_earlier
+        knight_later = [[[] for _ in range(problem.n_rows)] for _ in range(problem.n)]
+        for col in range(problem.n):
+            for row in range(problem.n_rows):
+                for other_col, other_row in problem.knight_earlier[col][row]:
+                    knight_later[other_col][other_row].append((col, 1 << row))
+
+        self._line_masks = line_masks
+        self._knight_later = knight_later
+        self._forbidden = [0] * problem.n
+        self._placed = []
+
+        solution = tuple(self._placed) if self._place(0, 0) else None
+
+        self.metrics["time_taken"] = time.perf_counter() - start_time
+        self.metrics["solution"] = solution
+        return solution
+
+    def _place(self, col, occupied):
+        """
+        tries every row of column col, recursing on the next column
+        :param occupied: bitmask of the attack lines already taken
+        """
+        if col == self.problem.n:
+            return True
+
+        masks = self._line_masks[col]
+        knight_later = self._knight_later[col]
+        forbidden_rows = self._forbidden[col]
+        forbidden = self._forbidden
+
+        for row in range(self.problem.n_rows):
+            mask = masks[row]
+            if mask & occupied or (forbidden_rows >> row) & 1:
+                continue
+
+            self.metrics["nodes_expanded"] += 1
+            self._placed.append(row)
+
+            #knight attacks on later columns, old values kept for undoing
+            saved = [(other_col, forbidden[other_col]) for other_col, _ in knight_later[row]]
+            for other_col, bit in knight_later[row]:
+                forbidden[other_col] |= bit
+
+            if self._place(col + 1, occupied | mask):
+                return True
+
+            for other_col, value in saved:
+                forbidden[other_col] = value
+            self._placed.pop()
+            self.metrics["backtracks"] += 1
+
+        return False
@@ -0,0 +1,206 @@
+"""
+Unified command line entry point for one-shot N-Queens solves.
+
+Designed for the "many tiny N" use case, where interpreter start-up and imports
+cost more than the solve itself: only argparse is imported at load time, every
+backend (and its third party dependencies, e.g. python-constraint for CSP) is
+imported lazily once the engine has actually been chosen.
+
+USAGE
+    python nqueens.py 8                          -> A* (h1), solution as tuple
+    python nqueens.py 8 --engine csp --format board
+    python nqueens.py 12 --engine astar --heuristic 2 --format json --metrics
+    python nqueens.py 11 --engine bitmask --toroidal --superqueens --format board
+"""
+
+import argparse
+import sys
+
+
+#ENGINE BUILDERS: each one imports its own backend only when called
+#and returns (solution, metrics)
+
+def _solve_astar(problem, args):
+    from src.astar_solver import AStarSolver
+
+    external_memory = None
+    if args.external_memory:
+        from src.external_memory import ExternalMemoryConfig
+        external_memory = ExternalMemoryConfig(max_frontier_in_memory=args.frontier_in_memory,
+                                               spill_dir=args.spill_dir,
+                                               explored_backing="mmap")
+
+    solver = AStarSolver(problem, heuristic_code=args.heuristic,
+                         external_memory=external_memory)
+    solution = solver.solve()
+    return solution, solver.metrics
+
+
+def _solve_csp(problem, args):
+    from src.csp_solver import CSPSolver, CSPConfig
+
+    config = CSPConfig(encoding=args.encoding, max_solutions_to_collect=1)
+    solver = CSPSolver(args.n, config=config, board=problem)
+    solution = solver.solve()
+    return solution, solver.metrics
+
+
+def _solve_bitmask(problem, args):
+    from src.bitmask_solver import BitmaskSolver
+
+    solver = BitmaskSolver(problem)
+    solution = solver.solve()
+    return solution, solver.metrics
+
+
+#MODULAR SWITCH CASE (same spirit as HEURISTICS in nqueens.py)
+
+ENGINES = {
+    "astar": _solve_astar,
+    "csp": _solve_csp,
+    "bitmask": _solve_bitmask,
+}
+
+#engine specific options: (engines accepting it, default once accepted)
+#they are parsed with a None default, so that an option given to the wrong engine can be rejected
+ENGINE_OPTIONS = {
+    "heuristic": (["astar"], "1"),
+    "encoding": (["csp"], "pairwise_diagonal"),
+    "external_memory": (["astar"], False),
+    "frontier_in_memory": (["astar"], 100_000),
+    "spill_dir": (["astar"], None),
+}
+
+#options that only make sense together with --external-memory
+EXTERNAL_MEMORY_OPTIONS = ["frontier_in_memory", "spill_dir"]
+
+
+# ---------------------------------------------------------------------
+# Output formats
+# ---------------------------------------------------------------------
+
+def format_tuple(solution, n, n_rows):
+    return str(solution)
+
+
+def format_board(solution, n, n_rows):
+    """
+    one line per ROW, 'Q' where the queen of that column is placed
+    """
+    lines = []
+    for row in range(n_rows):
+        lines.append(" ".join("Q" if solution[col] == row else "." for col in range(n)))
+    return "\n".join(lines)
+
+
+def format_csv(solution, n, n_rows):
+    return ",".join(str(row) for row in solution)
+
+
+def format_json(solution, n, n_rows):
+    import json
+    return json.dumps({"n": n, "rows": n_rows, "solution": list(solution)})
+
+
+FORMATTERS = {
+    "tuple": format_tuple,
+    "board": format_board,
+    "csv": format_csv,
+    "json": format_json,
+}
+
+
+def _format_metrics(metrics, fmt):
+    #solutions_collected may be long and is already printed as the solution
+    shown = {k: v for k, v in metrics.items() if k not in ("solution", "solutions_collected")}
+
+    if fmt == "json":
+        import json
+        return json.dumps({"metrics": shown}, default=str)
+
+    return "\n".join(f"{key}: {value}" for key, value in shown.items())
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nqueens", description="Solve a single N-Queens instance.")
+    parser.add_argument("n", type=int, help="number of queens (and cells per side)")
+    parser.add_argument("-e", "--engine", choices=sorted(ENGINES), default="astar",
+                        help="solving backend (default: astar)")
+    parser.add_argument("-f", "--format", choices=sorted(FORMATTERS), default="tuple",
+                        help="solution output format (default: tuple)")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="number of rows, >= n (default: n, square board)")
+    parser.add_argument("--toroidal", action="store_true",
+                        help="board edges wrap around")
+    parser.add_argument("--superqueens", action="store_true",
+                        help="queens also move as knights")
+    parser.add_argument("--heuristic", default=None,
+                        help="A* heuristic code, see HEURISTICS in nqueens.py (default: 1)")
+    parser.add_argument("--encoding", default=None,
+                        help="CSP encoding: pairwise_diagonal | alldiff_diagonals (default: pairwise_diagonal)")
+    parser.add_argument("--external-memory", action="store_true", default=None,
+                        help="A* only: packed explored set (mmap) and frontier spilled to disk")
+    parser.add_argument("--frontier-in-memory", type=int, default=None,
+                        help="A* external-memory mode: frontier entries kept in RAM (default: 100000)")
+    parser.add_argument("--spill-dir", default=None,
+                        help="A* external-memory mode: directory for spill files (default: system temp dir)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="also print the solver metrics")
+    return parser
+
+
+def _check_engine_options(args):
+    """
+    returns an error message for options the chosen engine would ignore (None if all good),
+    and fills in the defaults of the accepted ones
+    """
+    given = [option for option in ENGINE_OPTIONS if getattr(args, option) is not None]
+
+    for option in given:
+        engines = ENGINE_OPTIONS[option][0]
+        if args.engine not in engines:
+            flag = "--" + option.replace("_", "-")
+            return f"{flag} does not apply to engine '{args.engine}' (only: {', '.join(engines)})"
+
+    for option in EXTERNAL_MEMORY_OPTIONS:
+        if option in given and not args.external_memory:
+            return f"--{option.replace('_', '-')} requires --external-memory"
+
+    for option, (_, default) in ENGINE_OPTIONS.items():
+        if getattr(args, option) is None:
+            setattr(args, option, default)
+
+    return None
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.n < 1:
+        print("ERROR: n must be a positive integer", file=sys.stderr)
+        return 2
+
+    error = _check_engine_options(args)
+    if error:
+        print(f"ERROR: {error}", file=sys.stderr)
+        return 2
+
+    try:
+        from src.nqueens import NQueensProblem
+        problem = NQueensProblem(args.n, n_rows=args.rows, toroidal=args.toroidal,
+                                 knight_moves=args.superqueens)
+        solution, metrics = ENGINES[args.engine](problem, args)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if solution is None:
+        print(f"NO SOLUTION FOR N = {args.n}", file=sys.stderr)
+        return 1
+
+    print(FORMATTERS[args.format](solution, problem.n, problem.n_rows))
+
+    if args.metrics:
+        print(_format_metrics(metrics, args.format))
+
+    return 0
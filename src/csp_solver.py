@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List, Any, Iterable
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, List, Any, Iterable
+
+# python-constraint is only imported when a CSP is actually built (see solve()),
+# so that importing this module (e.g. from the CLI) stays cheap
+if TYPE_CHECKING:
+    from constraint import Problem
 
-from constraint import Problem, AllDifferentConstraint
+from src.nqueens import NQueensProblem
 
 
 @dataclass(frozen=True)
@@ -20,17 +27,27 @@ class CSPSolver:
 
     Variables:
       - One variable per column (0..n-1)
-      - Value is the row index (0..n-1)
+      - Value is the row index (0..n_rows-1)
 
     Supported encodings:
       - "pairwise_diagonal": O(n^2) binary constraints for diagonals
       - "alldiff_diagonals": auxiliary diagonal-id variables + AllDifferent on diagonals
-    """
 
-    def __init__(self, n: int, config: Optional[CSPConfig] = None):
+    Diagonals are the precomputed attack lines of the board (see NQueensProblem),
+    so both encodings also work on its variants (rectangular, toroidal, superqueens,
+    the latter with extra binary knight constraints).
+    """
 
+    def __init__(self, n: int, config: Optional[CSPConfig] = None, board: Optional[NQueensProblem] = None):
+        """
+        :param board: optional NQueensProblem describing the board variant (standard n x n board if None)
+        """
         self.n = n
         self.config = config or CSPConfig()
+        self.board = board or NQueensProblem(n)
+
+        if self.board.n != n:
+            raise ValueError(f"Board has {self.board.n} columns, expected {n}")
 
         self.metrics: Dict[str, Any] = {
             # Timing
@@ -43,7 +60,7 @@ class CSPSolver:
             # CSP structure metric
             "variables_count": 0,
             "constraints_count": 0,
-            "domain_size_mean": float(n),
+            "domain_size_mean": float(self.board.n_rows),
 
             "row_variables_count": n,
             "aux_variables_count": 0,
@@ -58,10 +75,12 @@ class CSPSolver:
     def solve(self) -> Optional[Tuple[int, ...]]:
         start_time = time.perf_counter()
 
+        from constraint import Problem, AllDifferentConstraint
+
         problem = Problem()
 
         cols = list(range(self.n))
-        rows = list(range(self.n))
+        rows = list(range(self.board.n_rows))
         problem.addVariables(cols, rows)
 
         #all queens must be in different ROWS
@@ -77,6 +96,9 @@ class CSPSolver:
         else:
             raise ValueError(f"Unknown encoding: {self.config.encoding}")
 
+        if self.board.knight_moves:
+            self._add_knight_constraints(problem, cols)
+
         self._fill_structure_metrics(problem)
 
         solutions = self._collect_solutions(problem, cols)
@@ -99,22 +121,27 @@ class CSPSolver:
     def _add_pairwise_diagonal_constraints(self, problem: Problem, cols: List[int]) -> None:
         """
         Pairwise diagonal constraints encoding:
-        For each pair of columns (c1, c2), enforce (r1 - r2) != (c1 - c2) (absolute values)
+        For each pair of columns (c1, c2), enforce different diagonal and anti-diagonal line ids
+        (on the standard board: (r1 - r2) != (c1 - c2), absolute values)
         complexity: O(n^2) BINARY constraints.
         """
+        cell_lines = self.board.cell_lines
+
         for c1 in cols:
             for c2 in range(c1 + 1, self.n):
-                # Capture c1/c2 at definition time via default args (important in Python closures)
-                def no_diagonal_conflict(r1: int, r2: int, c1=c1, c2=c2) -> bool:
-                    return abs(r1 - r2) != abs(c1 - c2)
+                # Capture the column line tables at definition time via default args (important in Python closures)
+                def no_diagonal_conflict(r1: int, r2: int, lines1=cell_lines[c1], lines2=cell_lines[c2]) -> bool:
+                    a = lines1[r1]
+                    b = lines2[r2]
+                    return a[1] != b[1] and a[2] != b[2]
 
                 problem.addConstraint(no_diagonal_conflict, (c1, c2))
 
     def _add_alldiff_diagonal_constraints(self, problem: Problem, cols: List[int]) -> None:
         """
         For each column c with row r:
-          d1 = r - c  (main diagonal id)
-          d2 = r + c  (anti diagonal id)
+          d1 = id of the main diagonal through (c, r)  (r - c on the standard board)
+          d2 = id of the anti diagonal through (c, r)  (r + c on the standard board)
         Enforce:
           AllDifferent(d1_0..d1_{n-1})
           AllDifferent(d2_0..d2_{n-1})
@@ -124,15 +151,16 @@ class CSPSolver:
           - 2n linking constraints
           - 2 AllDifferent constraints
         """
-        d1_vars = [f"d1_{c}" for c in cols]  # r - c
-        d2_vars = [f"d2_{c}" for c in cols]  # r + c
+        from constraint import AllDifferentConstraint
+
+        d1_vars = [f"d1_{c}" for c in cols]
+        d2_vars = [f"d2_{c}" for c in cols]
 
-        # Domains:
-        # r in [0, n-1], c in [0, n-1]
-        # d1 in [-(n-1), +(n-1)]
-        # d2 in [0, 2(n-1)]
-        d1_domain = list(range(-(self.n - 1), self.n))
-        d2_domain = list(range(0, 2 * (self.n - 1) + 1))
+        # Domains: the line ids of each direction
+        # (2n-1 diagonals per direction on the standard board, n on a toroidal one)
+        d1_domain = self.board.line_ids(1)
+        d2_domain = self.board.line_ids(2)
+        cell_lines = self.board.cell_lines
 
         problem.addVariables(d1_vars, d1_domain)
         problem.addVariables(d2_vars, d2_domain)
@@ -145,11 +173,11 @@ class CSPSolver:
             d1 = f"d1_{c}"
             d2 = f"d2_{c}"
 
-            def link_d1(r: int, d: int, c=c) -> bool:
-                return d == r - c
+            def link_d1(r: int, d: int, lines=cell_lines[c]) -> bool:
+                return d == lines[r][1]
 
-            def link_d2(r: int, d: int, c=c) -> bool:
-                return d == r + c
+            def link_d2(r: int, d: int, lines=cell_lines[c]) -> bool:
+                return d == lines[r][2]
 
             problem.addConstraint(link_d1, (row_var, d1))
             problem.addConstraint(link_d2, (row_var, d2))
@@ -157,6 +185,22 @@ class CSPSolver:
         problem.addConstraint(AllDifferentConstraint(), d1_vars)
         problem.addConstraint(AllDifferentConstraint(), d2_vars)
 
+    def _add_knight_constraints(self, problem: Problem, cols: List[int]) -> None:
+        """
+        Superqueens: binary constraint for every pair of columns a knight move can connect
+        (|c1 - c2| <= 2, plus the wrap-around pairs on a toroidal board).
+        """
+        board = self.board
+
+        for c2 in cols:
+            linked_cols = {other_col for row in range(board.n_rows) for other_col, _ in board.knight_earlier[c2][row]}
+
+            for c1 in sorted(linked_cols):
+                def no_knight_conflict(r1: int, r2: int, c1=c1, attacked=board.knight_earlier[c2]) -> bool:
+                    return (c1, r1) not in attacked[r2]
+
+                problem.addConstraint(no_knight_conflict, (c1, c2))
+
     # ---------------------------------------------------------------------
     # Solving + metrics utilities
     # ---------------------------------------------------------------------
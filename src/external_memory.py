@@ -0,0 +1,363 @@
+"""
+External-memory data structures for A* (see AStarSolver with an ExternalMemoryConfig).
+
+A state as a Python tuple of ints costs ~56 + 8n bytes, plus the set/heap entry around it,
+while its information content is n small integers. Here states are packed into
+fixed-width byte records instead:
+
+    - StatePacker:       state tuple <-> fixed width record (1 byte per column up to N = 254, 2 bytes above)
+    - PackedStateSet:    explored set as an open addressing hash table over a bytearray
+                         (or a file backed mmap, so the OS can page it out)
+    - SpillingFrontier:  priority queue keeping only the best entries in RAM,
+                         the low priority tail is spilled to sorted run files and merged back lazily
+"""
+
+import heapq
+import io
+import mmap
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ExternalMemoryConfig:
+    """
+    Configuration for the external-memory A* mode.
+    """
+    max_frontier_in_memory: int = 100_000  # frontier entries kept in RAM before spilling the tail
+    spill_dir: Optional[str] = None        # where run files (and the mmap table) go, default: system temp dir
+    explored_backing: str = "memory"       # "memory" (bytearray) | "mmap" (file backed table)
+    initial_capacity: int = 1 << 16        # explored table slots, doubled when the load factor is exceeded
+    max_load_factor: float = 0.7
+
+
+class StatePacker:
+    """
+    Fixed width records for partial states of an N-Queens problem.
+    Unused columns are filled with a padding value (never a valid row),
+    so states of different length share the same record size.
+    EXAMPLE (n = 4): (1, 3) -> b'\\x01\\x03\\xff\\xff'
+    """
+
+    def __init__(self, n, n_rows=None):
+        """
+        :param n: number of columns (record length)
+        :param n_rows: number of rows (value range), defaults to n
+        """
+        self.n = n
+        n_rows = n if n_rows is None else n_rows
+        self.typecode = "B" if n_rows < 0xFF else "H"
+        self.padding = 0xFF if self.typecode == "B" else 0xFFFF
+        if n_rows >= self.padding:
+            raise ValueError(f"{n_rows} rows are too many for packed states")
+
+        self.record_size = n * array(self.typecode).itemsize
+
+    def pack(self, state):
+        values = array(self.typecode, state)
+        values.extend([self.padding] * (self.n - len(state)))
+        return values.tobytes()
+
+    def unpack(self, record):
+        values = array(self.typecode)
+        values.frombytes(record)
+        try:
+            length = values.index(self.padding)
+        except ValueError:
+            length = self.n
+        return tuple(values[:length])
+
+
+class PackedStateSet:
+    """
+    Set of packed records: open addressing (linear probing) hash table.
+
+    SLOT LAYOUT: 1 flag byte (0 = empty, 1 = used) + record_size bytes
+    the whole table is a single flat buffer, no per state Python objects.
+    """
+
+    def __init__(self, record_size, initial_capacity=1 << 16, max_load_factor=0.7,
+                 backing="memory", spill_dir=None):
+        if backing not in ("memory", "mmap"):
+            raise ValueError(f"Unknown explored set backing: {backing}")
+        # a full table would make lookups of missing records probe forever
+        if not 0 < max_load_factor < 1:
+            raise ValueError(f"max_load_factor must be in (0, 1), got {max_load_factor}")
+
+        self.record_size = record_size
+        self.slot_size = record_size + 1
+        self.max_load_factor = max_load_factor
+        self.backing = backing
+        self.spill_dir = spill_dir
+
+        self._file = None
+        self._count = 0
+        self._capacity = 0
+        self._table = self._allocate(max(8, initial_capacity))
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, record):
+        return self._find(record)[1]
+
+    def add(self, record):
+        """
+        returns True if the record was not in the set yet
+        """
+        if (self._count + 1) > self._capacity * self.max_load_factor:
+            self._grow()
+
+        offset, found = self._find(record)
+        if found:
+            return False
+
+        self._table[offset] = 1
+        self._table[offset + 1:offset + self.slot_size] = record
+        self._count += 1
+        return True
+
+    @property
+    def nbytes(self):
+        return self._capacity * self.slot_size
+
+    def bytes_per_state(self):
+        """
+        table bytes per stored state (load factor included)
+        """
+        return self.nbytes / self._count if self._count else float(self.nbytes)
+
+    def close(self):
+        if self.backing == "mmap" and self._table is not None:
+            self._table.close()
+            self._file.close()
+        self._table = None
+
+    def _allocate(self, capacity):
+        self._capacity = capacity
+        size = capacity * self.slot_size
+
+        if self.backing == "memory":
+            return bytearray(size)
+
+        # a fresh temporary file per table size, removed by the OS once closed
+        if self._file is not None:
+            self._file.close()
+        self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._file.truncate(size)
+        return mmap.mmap(self._file.fileno(), size)
+
+    def _find(self, record):
+        """
+        linear probing: (offset of the slot holding the record or of the first empty slot, found)
+        """
+        table = self._table
+        slot_size = self.slot_size
+        index = hash(record) % self._capacity
+
+        while True:
+            offset = index * slot_size
+            if not table[offset]:
+                return offset, False
+            if table[offset + 1:offset + slot_size] == record:
+                return offset, True
+            index += 1
+            if index == self._capacity:
+                index = 0
+
+    def _grow(self):
+        old_table = self._table
+        old_capacity = self._capacity
+        old_file = self._file
+        slot_size = self.slot_size
+
+        if self.backing == "mmap":
+            self._file = None
+        self._table = self._allocate(old_capacity * 2)
+
+        for index in range(old_capacity):
+            offset = index * slot_size
+            if old_table[offset]:
+                record = bytes(old_table[offset + 1:offset + slot_size])
+                new_offset = self._find(record)[0]
+                self._table[new_offset] = 1
+                self._table[new_offset + 1:new_offset + slot_size] = record
+
+        if self.backing == "mmap":
+            old_table.close()
+            old_file.close()
+
+
+class _SpillRun:
+    """
+    Sorted run file of frontier entries, read back sequentially in blocks.
+    """
+
+    HEADER = struct.Struct("<dqq")  # f, tie breaker, g
+    BLOCK_ENTRIES = 4096
+
+    @classmethod
+    def buffer_nbytes(cls, record_size):
+        """
+        RAM held by an open run: one block of entries plus the file buffer
+        """
+        block = cls.BLOCK_ENTRIES * (cls.HEADER.size + record_size)
+        return sys.getsizeof(bytes(block)) + io.DEFAULT_BUFFER_SIZE
+
+    def __init__(self, entries, record_size, spill_dir):
+        self.entry_size = self.HEADER.size + record_size
+        self._file = tempfile.TemporaryFile(dir=spill_dir)
+
+        self.remaining = 0
+        for f, tie, record, g in entries:
+            self._file.write(self.HEADER.pack(f, tie, g))
+            self._file.write(record)
+            self.remaining += 1
+
+        self._file.flush()
+        self._file.seek(0)
+        self._block = b""
+        self._pos = 0
+        self.head = None
+        self.advance()
+
+    def advance(self):
+        """
+        loads the next entry in self.head (None once the run is exhausted)
+        """
+        if self.head is not None:
+            self.remaining -= 1
+
+        if self._pos >= len(self._block):
+            self._block = self._file.read(self.entry_size * self.BLOCK_ENTRIES)
+            self._pos = 0
+            if not self._block:
+                self.close()
+                return
+
+        f, tie, g = self.HEADER.unpack_from(self._block, self._pos)
+        start = self._pos + self.HEADER.size
+        record = self._block[start:start + self.entry_size - self.HEADER.size]
+        self._pos += self.entry_size
+        self.head = (f, tie, record, g)
+
+    def drain(self):
+        """
+        yields the remaining entries in order (used when merging runs)
+        """
+        while self.head is not None:
+            entry = self.head
+            self.advance()
+            yield entry
+
+    def close(self):
+        self.head = None
+        self._file.close()
+
+
+class SpillingFrontier:
+    """
+    Priority queue of (f, tie_breaker, packed_state, g) entries.
+
+    At most max_in_memory entries live in the in-RAM heap: when it is full,
+    the worse half is sorted and written to a run file. Pops merge the heap with
+    the heads of the runs, so entries come out in the same (f, tie_breaker) order
+    as with a plain heapq. Once more than max_runs runs are open, the smaller half
+    of them is merged into a single run, bounding the number of open files
+    without rewriting the big runs over and over.
+
+    peak_nbytes() estimates the RAM the frontier held at its largest
+    (heap entries plus the block buffers of the open runs).
+    """
+
+    def __init__(self, record_size, max_in_memory=100_000, spill_dir=None, max_runs=64):
+        self.record_size = record_size
+        self.max_in_memory = max(2, max_in_memory)
+        self.spill_dir = spill_dir
+        self.max_runs = max(2, max_runs)
+
+        self._heap = []
+        self._runs = []  # heap of (head f, head tie, run id, run)
+        self._spilled_pending = 0
+
+        self.spilled_runs = 0
+        self.spilled_entries = 0
+        self.peak_in_memory = 0
+        self.peak_open_runs = 0
+
+        #heap slot + (f, tie, record, g) tuple, its float / int / bytes items (small g values are shared)
+        self.entry_nbytes = (8 + sys.getsizeof((0.0, 0, b"", 0)) + sys.getsizeof(0.0)
+                             + sys.getsizeof(1 << 30) + sys.getsizeof(bytes(record_size)))
+
+    def __len__(self):
+        return len(self._heap) + self._spilled_pending
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def push(self, entry):
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > self.peak_in_memory:
+            self.peak_in_memory = len(self._heap)
+        if len(self._heap) > self.max_in_memory:
+            self._spill()
+
+    def pop(self):
+        if self._runs and (not self._heap or self._runs[0][:2] < self._heap[0][:2]):
+            _, _, run_id, run = heapq.heappop(self._runs)
+            entry = run.head
+            run.advance()
+            if run.head is not None:
+                heapq.heappush(self._runs, (run.head[0], run.head[1], run_id, run))
+            self._spilled_pending -= 1
+            return entry
+
+        return heapq.heappop(self._heap)
+
+    def _spill(self):
+        """
+        keeps the best half in RAM (a sorted list is a valid heap), writes the rest as a sorted run
+        """
+        self._heap.sort()
+        keep = len(self._heap) // 2
+        tail = self._heap[keep:]
+        del self._heap[keep:]
+
+        self._add_run(_SpillRun(tail, self.record_size, self.spill_dir))
+        self.spilled_entries += len(tail)
+        self._spilled_pending += len(tail)
+
+        if len(self._runs) > self.max_runs:
+            self._merge_runs()
+
+    def _add_run(self, run):
+        heapq.heappush(self._runs, (run.head[0], run.head[1], self.spilled_runs, run))
+        self.spilled_runs += 1
+        self.peak_open_runs = max(self.peak_open_runs, len(self._runs))
+
+    def peak_nbytes(self):
+        return (self.peak_in_memory * self.entry_nbytes
+                + self.peak_open_runs * _SpillRun.buffer_nbytes(self.record_size))
+
+    def _merge_runs(self):
+        """
+        k-way merge of the smaller half of the open runs into a single sorted run
+        """
+        by_size = sorted(self._runs, key=lambda item: item[3].remaining)
+        half = len(by_size) // 2
+        runs = [run for _, _, _, run in by_size[:half]]
+        self._runs = by_size[half:]
+        heapq.heapify(self._runs)
+        merged = heapq.merge(*(run.drain() for run in runs), key=lambda entry: entry[:2])
+        self._add_run(_SpillRun(merged, self.record_size, self.spill_dir))
+
+    def close(self):
+        for _, _, _, run in self._runs:
+            run.close()
+        self._runs = []
+        self._heap = []
+        self._spilled_pending = 0
@@ -11,13 +11,56 @@ class NQueensProblem:
         - the index (i) is the COLUMN of interest
         - the value (v) is the ROW (of the i-th column) where the queen is meant to be placed
         EXAMPLE: (1, 4, 4) means: queen in C0, R1, queen in C1, R4, queen in C2, R4
+
+    VARIANTS (all sharing the same precomputed attack-line core)
+        - rectangular: n_rows >= n, i.e. n queens (one per column) on an n_rows x n board
+        - toroidal: rows and diagonals wrap around the board edges
+        - knight_moves: queens also attack like knights (superqueens)
+
+    ATTACK LINES
+        every row / diagonal / anti-diagonal of the board gets an integer id, computed once:
+        cell_lines[col][row] lists the ids of the lines through that cell.
+        two queens attack each other along a line if they share its id, so conflicts
+        are counted with per-line occupancy counters instead of comparing every pair of queens.
+        knight attacks are not lines: knight_earlier[col][row] lists the attacked cells in
+        earlier columns, so each attacking pair is found exactly once.
+        on some toroidal boards a couple of cells shares more than one attack line
+        (both diagonals when n_rows is even, or a line and a knight move) and the counters
+        see it more than once: overlap_earlier[col][row] lists such cells in earlier columns,
+        once per extra attack, so each couple is still counted once.
     """
 
-    def __init__(self, n):
+    #(delta col, delta row) of each attack line direction
+    LINE_DIRECTIONS = [(1, 0), (1, 1), (1, -1)]
+    KNIGHT_MOVES = [(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)]
+
+    def __init__(self, n, n_rows=None, toroidal=False, knight_moves=False):
         """        
-        :param n: the number of queens
+        :param n: the number of queens (= number of columns)
+        :param n_rows: number of rows, defaults to n (square board)
+        :param toroidal: board edges wrap around
+        :param knight_moves: queens also move as knights (superqueens)
         """
         self.n = n
+        self.n_rows = n if n_rows is None else n_rows
+        self.toroidal = toroidal
+        self.knight_moves = knight_moves
+
+        if self.n_rows < n:
+            raise ValueError(f"Need at least as many rows as queens ({self.n_rows} < {n})")
+
+        self.num_lines = 0
+        self.cell_lines = [[() for _ in range(self.n_rows)] for _ in range(n)]
+        for direction in self.LINE_DIRECTIONS:
+            self._label_lines(direction)
+
+        self.knight_earlier = [[() for _ in range(self.n_rows)] for _ in range(n)]
+        if knight_moves:
+            self._link_knight_moves()
+
+        self.overlap_earlier = [[() for _ in range(self.n_rows)] for _ in range(n)]
+        if toroidal:
+            self._link_overlapping_attacks()
 
     def get_initial_state(self):
         return ()
@@ -42,38 +85,173 @@ class NQueensProblem:
             return []
 
         successors = []
-        for row in range(self.n):
+        for row in range(self.n_rows):
             new_state = state + (row,) #immutable tuple
             action = f"Place at ({current_col}, {row})"
             cost = 1
             successors.append((action, new_state, cost))
-        
+
         return successors
     
     def count_conflicts(self, state):
         """
         counts how many couples of queens can eat each other
+        (each couple once, even when it shares several attack lines)
+        full count: to score every child of a state, child_conflicts() is much cheaper
         """
         conflicts = 0
-        num_queens = len(state)
+        occupancy = [0] * self.num_lines
 
-        for i in range(num_queens):
-            for j in range(i+1, num_queens):
-                row_i = state[i]
-                row_j = state[j]
+        for col, row in enumerate(state):
+            for line in self.cell_lines[col][row]:
+                conflicts += occupancy[line]
+                occupancy[line] += 1
 
-                if row_i == row_j:
+            for other_col, other_row in self.knight_earlier[col][row]:
+                if state[other_col] == other_row:
                     conflicts += 1
-                    continue
-                    
-                delta_row = abs(row_i - row_j)
-                delta_col = abs(i - j)
 
-                if delta_row == delta_col:
-                    conflicts += 1
+            for other_col, other_row in self.overlap_earlier[col][row]:
+                if state[other_col] == other_row:
+                    conflicts -= 1
 
         return conflicts
-    
+
+    def child_conflicts(self, state):
+        """
+        INCREMENTAL CONFLICT ACCOUNTING
+        conflicts of state + (row,) for every row of the next column,
+        from a single pass over state: O(n + n_rows) instead of n_rows full counts
+        (same order as get_successors(state), see CHILD_HEURISTICS)
+        """
+        col = len(state)
+        if col >= self.n:
+            return []
+
+        conflicts = 0
+        occupancy = [0] * self.num_lines
+        for c, r in enumerate(state):
+            for line in self.cell_lines[c][r]:
+                conflicts += occupancy[line]
+                occupancy[line] += 1
+            for other_col, other_row in self.knight_earlier[c][r]:
+                if state[other_col] == other_row:
+                    conflicts += 1
+            for other_col, other_row in self.overlap_earlier[c][r]:
+                if state[other_col] == other_row:
+                    conflicts -= 1
+
+        result = []
+        for row in range(self.n_rows):
+            added = 0
+            for line in self.cell_lines[col][row]:
+                added += occupancy[line]
+            for other_col, other_row in self.knight_earlier[col][row]:
+                if state[other_col] == other_row:
+                    added += 1
+            for other_col, other_row in self.overlap_earlier[col][row]:
+                if state[other_col] == other_row:
+                    added -= 1
+            result.append(conflicts + added)
+
+        return result
+
+    def line_ids(self, direction_index):
+        """
+        sorted ids of the lines of one direction (0 = rows, 1 = diagonals, 2 = anti-diagonals)
+        """
+        ids = set()
+        for col in range(self.n):
+            for row in range(self.n_rows):
+                ids.add(self.cell_lines[col][row][direction_index])
+        return sorted(ids)
+
+    # ---------------------------------------------------------------------
+    # Attack-line precomputation
+    # ---------------------------------------------------------------------
+
+    def _step(self, col, row, delta_col, delta_row):
+        """
+        next cell along (delta_col, delta_row), None if it falls off a non toroidal board
+        """
+        col += delta_col
+        row += delta_row
+        if self.toroidal:
+            return col % self.n, row % self.n_rows
+        if 0 <= col < self.n and 0 <= row < self.n_rows:
+            return col, row
+        return None
+
+    def _label_lines(self, direction):
+        """
+        walks every line of the given direction once, giving all of its cells the same id
+        """
+        delta_col, delta_row = direction
+        labelled = set()
+
+        for col in range(self.n):
+            for row in range(self.n_rows):
+                if (col, row) in labelled:
+                    continue
+
+                line = self.num_lines
+                self.num_lines += 1
+
+                #forward and backward from the starting cell (on a torus the walk cycles back)
+                line_cells = {(col, row)}
+                for sign in (1, -1):
+                    cell = self._step(col, row, sign * delta_col, sign * delta_row)
+                    while cell is not None and cell not in line_cells:
+                        line_cells.add(cell)
+                        cell = self._step(cell[0], cell[1], sign * delta_col, sign * delta_row)
+
+                for c, r in line_cells:
+                    labelled.add((c, r))
+                    self.cell_lines[c][r] = self.cell_lines[c][r] + (line,)
+
+    def _link_knight_moves(self):
+        for col in range(self.n):
+            for row in range(self.n_rows):
+                earlier = set()
+                for delta_col, delta_row in self.KNIGHT_MOVES:
+                    cell = self._step(col, row, delta_col, delta_row)
+                    if cell is not None and cell[0] < col:
+                        earlier.add(cell)
+                self.knight_earlier[col][row] = tuple(sorted(earlier))
+
+    def _link_overlapping_attacks(self):
+        """
+        fills overlap_earlier on a toroidal board.
+        two straight lines cross at most once, and knight moves are never along a line,
+        so only toroidal boards have couples attacking each other in more than one way.
+        they look the same from every cell (both coordinates wrap around), so the
+        offsets of those couples are found around cell (0, 0) and then applied to every cell
+        """
+        knight_cells = set()
+        if self.knight_moves:
+            knight_cells = {self._step(0, 0, delta_col, delta_row) for delta_col, delta_row in self.KNIGHT_MOVES}
+
+        #(delta col, delta row, extra attacks) of the couples of cell (0, 0) attacking more than once
+        overlaps = []
+        origin_lines = self.cell_lines[0][0]
+        for col in range(self.n):
+            for row in range(self.n_rows):
+                if (col, row) == (0, 0):
+                    continue
+                shared = sum(line in origin_lines for line in self.cell_lines[col][row])
+                shared += (col, row) in knight_cells
+                if shared > 1:
+                    overlaps.append((col, row, shared - 1))
+
+        for col in range(self.n):
+            for row in range(self.n_rows):
+                earlier = []
+                for delta_col, delta_row, extra in overlaps:
+                    other_col = (col + delta_col) % self.n
+                    if other_col < col:
+                        earlier.extend([(other_col, (row + delta_row) % self.n_rows)] * extra)
+                self.overlap_earlier[col][row] = tuple(sorted(earlier))
+
 def heuristic0_null(problem, state):
     """
     in order to demonstrate what happens without heuristics
@@ -95,10 +273,30 @@ def heuristic2_aggressive(problem, state):
     conflicts = problem.count_conflicts(state)
     return conflicts * 10
 
+def heuristic1_children(problem, state):
+    """
+    heuristic1_conflicts of every successor of state, in get_successors() order
+    """
+    return problem.child_conflicts(state)
+
+def heuristic2_children(problem, state):
+    """
+    heuristic2_aggressive of every successor of state, in get_successors() order
+    """
+    return [conflicts * 10 for conflicts in problem.child_conflicts(state)]
+
 #MODULAR SWITCH CASE
 
 HEURISTICS = {
     "0": heuristic0_null,
     "1": heuristic1_conflicts,
     "2": heuristic2_aggressive
+}
+
+#heuristic of every successor of a state at once
+#(one child_conflicts() pass instead of a full count per child)
+#codes missing here are evaluated child by child through HEURISTICS
+CHILD_HEURISTICS = {
+    "1": heuristic1_children,
+    "2": heuristic2_children,
 }
\ No newline at end of file
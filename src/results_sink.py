@@ -0,0 +1,289 @@
+"""
+Append-only sink for experiment results.
+
+The experiment runners produce one row per (config, N) solve. Instead of reopening
+the results file for every row, the sink keeps its handle open and writes rows in
+batches, so that long sweeps (many configs x reps x N) pay the I/O cost once per batch.
+with max_delay_s, a write also flushes the batch once that many seconds have passed since
+the last flush: a crash that skips __exit__ (OOM kill, SIGKILL) then loses about max_delay_s
+seconds of solves at most, instead of up to batch_size - 1 slow solves.
+
+FORMATS
+    - "csv":     single CSV file, header + one line per row (default, no dependencies)
+    - "parquet": directory of parquet part files, one per flushed batch (needs pyarrow)
+    - "arrow":   directory of Arrow IPC part files, one per flushed batch (needs pyarrow)
+    if pyarrow is not installed, columnar formats fall back to CSV.
+
+RESUME
+    with resume=True the rows already on disk are read back and their key
+    (the key_columns values) is marked as completed: runners can skip them with is_done(key).
+    keys are compared as strings, so they survive the CSV round trip.
+
+GENERATION
+    a columnar results directory holds a GENERATION_FILE with a fresh id every time it is
+    rewritten from scratch (resume=False), so readers can tell reused part names apart.
+"""
+
+import csv
+import os
+import time
+import uuid
+
+COLUMNAR_FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+GENERATION_FILE = "_generation"
+
+
+def columnar_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_path(path, fmt):
+    """
+    maps the base CSV path onto the actual on-disk path for the given format
+    EXAMPLE: ("experiments/astar_results.csv", "parquet") -> "experiments/astar_results.parquet"
+    """
+    if fmt in COLUMNAR_FORMATS:
+        return os.path.splitext(path)[0] + COLUMNAR_FORMATS[fmt]
+    return path
+
+
+def make_key(values):
+    return tuple(str(v) for v in values)
+
+
+def iter_part_files(path):
+    """
+    part files of a columnar results directory, in writing order
+    """
+    if not os.path.isdir(path):
+        return []
+    return sorted(os.path.join(path, name) for name in os.listdir(path)
+                  if name.startswith("part-") and not name.endswith(".tmp"))
+
+
+def read_generation(path):
+    """
+    generation id of a columnar results directory (None if it has none)
+    """
+    try:
+        with open(os.path.join(path, GENERATION_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def read_part_rows(part_path):
+    """
+    rows (as dicts) of a single parquet / Arrow IPC part file
+    """
+    if part_path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        table = pq.read_table(part_path)
+    else:
+        import pyarrow.ipc as ipc
+        with ipc.open_file(part_path) as reader:
+            table = reader.read_all()
+    return table.to_pylist()
+
+
+class ResultsSink:
+    """
+    Batched, resumable writer for result rows (dicts keyed by column name).
+    Usable as a context manager: pending rows are flushed on exit, even after an exception.
+    """
+
+    def __init__(self, path, columns, key_columns, fmt="csv", batch_size=32, max_delay_s=None, resume=False,
+                 csv_formats=None):
+        """
+        :param path: base CSV path (columnar formats swap the extension, see resolve_path)
+        :param columns: ordered column names
+        :param key_columns: columns identifying a (config, N) run, used for resume
+        :param fmt: "csv" | "parquet" | "arrow"
+        :param batch_size: rows buffered before hitting the disk
+        :param max_delay_s: seconds after the last flush past which a write flushes the batch anyway
+                            (None: batch_size only)
+        :param resume: keep existing results and record their keys, instead of truncating
+        :param csv_formats: optional {column: format string} applied to CSV values only
+        """
+        if fmt != "csv" and fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown results format: {fmt}")
+        if fmt in COLUMNAR_FORMATS and not columnar_available():
+            print(f"WARNING: pyarrow not available, writing {fmt} results as CSV instead")
+            fmt = "csv"
+
+        self.fmt = fmt
+        self.path = resolve_path(path, fmt)
+        self.columns = list(columns)
+        self.key_columns = list(key_columns)
+        self.batch_size = max(1, batch_size)
+        self.max_delay_s = max_delay_s
+        self.csv_formats = csv_formats or {}
+
+        self._buffer = []
+        self._completed = {}  # key -> row, for rows already on disk
+        self._file = None
+        self._writer = None
+        self._next_part = 0
+        self._last_flush = time.monotonic()
+
+        if fmt == "csv":
+            self._open_csv(resume)
+        else:
+            self._open_columnar(resume)
+
+    # ---------------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------------
+
+    def is_done(self, key):
+        return make_key(key) in self._completed
+
+    def completed_row(self, key):
+        """
+        the row previously stored for this key (or None), e.g. to restore timeout status on resume
+        """
+        return self._completed.get(make_key(key))
+
+    def write(self, row):
+        self._buffer.append(row)
+        self._completed[make_key(row[c] for c in self.key_columns)] = row
+        if len(self._buffer) >= self.batch_size or self._delay_expired():
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        if self.fmt == "csv":
+            for row in self._buffer:
+                self._writer.writerow([self._csv_value(c, row.get(c)) for c in self.columns])
+            self._file.flush()
+        else:
+            self._write_part(self._buffer)
+
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _delay_expired(self):
+        return self.max_delay_s is not None and time.monotonic() - self._last_flush >= self.max_delay_s
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ---------------------------------------------------------------------
+    # CSV backend
+    # ---------------------------------------------------------------------
+
+    def _open_csv(self, resume):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume and os.path.exists(self.path):
+            self._load_csv_keys()
+
+        if resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            self._file = open(self.path, mode="a", newline='')
+            self._writer = csv.writer(self._file)
+        else:
+            self._file = open(self.path, mode="w", newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.columns)
+            self._file.flush()
+
+    def _load_csv_keys(self):
+        """
+        reads back completed rows; a partially written last line (crash mid-write) is cut off
+        refuses to resume if the header on disk is not self.columns (rows would land in the wrong columns)
+        """
+        with open(self.path, mode="r", newline='') as f:
+            header = next(csv.reader(f), None)
+        if header is not None and header != self.columns:
+            raise ValueError(f"Cannot resume {self.path}: its columns {header} differ from {self.columns}")
+
+        with open(self.path, mode="rb+") as f:
+            data = f.read()
+            if not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+        with open(self.path, mode="r", newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                if None in row or any(row.get(c) is None for c in self.key_columns):
+                    continue
+                self._completed[make_key(row[c] for c in self.key_columns)] = row
+
+    def _csv_value(self, column, value):
+        fmt = self.csv_formats.get(column)
+        if fmt is not None and isinstance(value, (int, float)):
+            return fmt.format(value)
+        return value
+
+    # ---------------------------------------------------------------------
+    # Columnar backend (parquet / Arrow IPC)
+    # ---------------------------------------------------------------------
+
+    def _open_columnar(self, resume):
+        # temporary parts left by a crash in _write_part are never renamed: drop them
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.startswith("part-") and name.endswith(".tmp"):
+                    os.remove(os.path.join(self.path, name))
+
+        parts = iter_part_files(self.path)
+
+        if not resume:
+            for part in parts:
+                os.remove(part)
+            parts = []
+
+        os.makedirs(self.path, exist_ok=True)
+
+        if not resume or read_generation(self.path) is None:
+            with open(os.path.join(self.path, GENERATION_FILE), "w") as f:
+                f.write(uuid.uuid4().hex)
+
+        for part in parts:
+            rows = read_part_rows(part)
+            if rows and list(rows[0]) != self.columns:
+                raise ValueError(f"Cannot resume {self.path}: its columns {list(rows[0])} differ from {self.columns}")
+            for row in rows:
+                self._completed[make_key(row[c] for c in self.key_columns)] = row
+        self._next_part = len(parts)
+
+    def _write_part(self, rows):
+        import pyarrow as pa
+
+        table = pa.Table.from_pylist([{c: row.get(c) for c in self.columns} for row in rows])
+        part_path = os.path.join(self.path, f"part-{self._next_part:06d}{COLUMNAR_FORMATS[self.fmt]}")
+        tmp_path = part_path + ".tmp"
+
+        # written under a temporary name and renamed: a crash never leaves a half written part
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, tmp_path)
+        else:
+            import pyarrow.ipc as ipc
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        os.replace(tmp_path, part_path)
+        self._next_part += 1
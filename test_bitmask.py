@@ -0,0 +1,29 @@
+from src.nqueens import NQueensProblem
+from src.bitmask_solver import BitmaskSolver
+
+def run_test():
+    print("=== TEST BITMASK SOLVER ===\n")
+
+    test_cases = [
+        # (name, problem, solvable)
+        ("Standard 8x8", NQueensProblem(8), True),
+        ("Standard 3x3", NQueensProblem(3), False),
+        ("Toroidal 7x7", NQueensProblem(7, toroidal=True), True),
+        ("Toroidal 8x8", NQueensProblem(8, toroidal=True), False),
+        ("Superqueens 10x10", NQueensProblem(10, knight_moves=True), True),
+        ("Superqueens 9x9", NQueensProblem(9, knight_moves=True), False),
+        ("Rectangular 3 queens on 5x3", NQueensProblem(3, n_rows=5), True),
+    ]
+
+    for name, problem, solvable in test_cases:
+        solver = BitmaskSolver(problem)
+        solution = solver.solve()
+        print(f"{name}: {solution} | nodes: {solver.metrics['nodes_expanded']} | time: {solver.metrics['time_taken']:.6f} sec")
+
+        assert (solution is not None) == solvable
+        if solution:
+            assert len(solution) == problem.n
+            assert problem.count_conflicts(solution) == 0
+
+if __name__ == "__main__":
+    run_test()
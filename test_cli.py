@@ -0,0 +1,40 @@
+import sys
+from src.cli import main, format_board
+
+def run_test():
+    N = 6
+    print(f"=== TEST CLI (N={N}) ===\n")
+
+    for engine in ["astar", "csp", "bitmask"]:
+        for fmt in ["tuple", "board", "csv", "json"]:
+            print(f"Testing engine: {engine}, format: {fmt}")
+            exit_code = main([str(N), "--engine", engine, "--format", fmt])
+            assert exit_code == 0
+            print("-" * 40)
+
+    print(f"Board for (1, 3, 0, 2):\n{format_board((1, 3, 0, 2), 4, 4)}")
+    assert format_board((1, 3, 0, 2), 4, 4).splitlines()[0] == ". . Q ."
+
+    # variants
+    assert main(["11", "--engine", "bitmask", "--toroidal", "--superqueens", "--format", "board"]) == 0
+    assert main(["5", "--rows", "7", "--engine", "astar"]) == 0
+    assert main(["5", "--rows", "3"]) == 2
+
+    # options the chosen engine would ignore are rejected
+    assert main([str(N), "--engine", "csp", "--heuristic", "2"]) == 2
+    assert main([str(N), "--engine", "bitmask", "--external-memory"]) == 2
+    assert main([str(N), "--engine", "astar", "--encoding", "alldiff_diagonals"]) == 2
+    assert main([str(N), "--frontier-in-memory", "10"]) == 2
+    assert main([str(N), "--external-memory", "--frontier-in-memory", "10"]) == 0
+
+    # no solution exists for N = 3
+    assert main(["3"]) == 1
+
+    # A* one-shot solve must not pull python-constraint in
+    sys.modules.pop("constraint", None)
+    main([str(N), "--engine", "astar"])
+    assert "constraint" not in sys.modules
+    print("Lazy imports: OK (constraint not loaded for A*)")
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,67 @@
+import heapq
+import random
+from src.nqueens import NQueensProblem
+from src.astar_solver import AStarSolver
+from src.external_memory import ExternalMemoryConfig, StatePacker, PackedStateSet, SpillingFrontier
+
+def run_test():
+    print("=== TEST EXTERNAL MEMORY A* ===\n")
+    rng = random.Random(0)
+
+    packer = StatePacker(8)
+    for state in [(), (3,), (0, 4, 7, 5, 2, 6, 1, 3)]:
+        record = packer.pack(state)
+        assert len(record) == packer.record_size
+        assert packer.unpack(record) == state
+    print(f"Packer: OK ({packer.record_size} bytes per record for N = 8)")
+
+    explored = PackedStateSet(packer.record_size, initial_capacity=8)
+    states = {tuple(rng.randrange(8) for _ in range(rng.randrange(9))) for _ in range(500)}
+    for state in states:
+        assert explored.add(packer.pack(state))
+        assert not explored.add(packer.pack(state))
+    assert len(explored) == len(states)
+    assert all(packer.pack(state) in explored for state in states)
+    print(f"Explored set: OK ({explored.bytes_per_state():.1f} bytes per state)")
+
+    for load_factor in [0, 1.0, 1.5]:
+        try:
+            PackedStateSet(packer.record_size, max_load_factor=load_factor)
+            assert False, "load factors outside (0, 1) must be rejected"
+        except ValueError:
+            pass
+
+    # entries must come out in the same order as with a plain heapq, even after spilling
+    frontier = SpillingFrontier(packer.record_size, max_in_memory=16, max_runs=4)
+    reference = []
+    for tie in range(2000):
+        entry = (rng.randrange(40), tie, packer.pack((tie % 8,)), 0)
+        frontier.push(entry)
+        heapq.heappush(reference, entry)
+        if rng.random() < 0.3:
+            assert frontier.pop() == heapq.heappop(reference)
+    while reference:
+        assert frontier.pop() == heapq.heappop(reference)
+    assert not frontier
+    print(f"Spilling frontier: OK ({frontier.spilled_runs} runs spilled)")
+
+    N = 7
+    for backing in ["memory", "mmap"]:
+        in_memory = AStarSolver(NQueensProblem(N), heuristic_code="1")
+        external = AStarSolver(NQueensProblem(N), heuristic_code="1",
+                               external_memory=ExternalMemoryConfig(max_frontier_in_memory=1000,
+                                                                    explored_backing=backing,
+                                                                    initial_capacity=64))
+        solution = external.solve()
+        assert solution == in_memory.solve()
+        assert external.metrics["nodes_expanded"] == in_memory.metrics["nodes_expanded"]
+        # bytes per state covers the frontier RAM too, not just the explored table
+        assert external.metrics["bytes_per_state"] * external.metrics["max_memory"] >= \
+            external.metrics["explored_bytes"] + external.metrics["frontier_bytes"] - 1e-6
+        assert external.metrics["frontier_bytes"] > 0
+        print(f"A* external memory ({backing}): {solution} | "
+              f"bytes per state: {external.metrics['bytes_per_state']:.1f} | "
+              f"spilled states: {external.metrics['spilled_states']}")
+
+if __name__ == "__main__":
+    run_test()
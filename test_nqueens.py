@@ -16,4 +16,24 @@ diag_state = (0, 1)
 print(f"Conflicts in (0,1): {prob.count_conflicts(diag_state)} EXPECTED 1") 
 
 good_state = (1, 3)
-print(f"Conflicts in (1,3): {prob.count_conflicts(good_state)} EXPECTED 0") 
\ No newline at end of file
+print(f"Conflicts in (1,3): {prob.count_conflicts(good_state)} EXPECTED 0") 
+
+# VARIANTS
+torus = NQueensProblem(5, toroidal=True)
+print(f"Toroidal conflicts in (0,4): {torus.count_conflicts((0, 4))} EXPECTED 1") # anti-diagonal wraps around the edge
+print(f"Toroidal conflicts in (0,2,4,1,3): {torus.count_conflicts((0, 2, 4, 1, 3))} EXPECTED 0")
+even_torus = NQueensProblem(4, toroidal=True)
+print(f"Toroidal conflicts in (0,1,2): {even_torus.count_conflicts((0, 1, 2))} EXPECTED 3") # C0-C2 share both diagonals, counted once
+
+superqueens = NQueensProblem(4, knight_moves=True)
+print(f"Superqueens conflicts in (1,3): {superqueens.count_conflicts((1, 3))} EXPECTED 1") # knight move
+
+rect = NQueensProblem(3, n_rows=5)
+print(f"Rectangular successors of (): {len(rect.get_successors(()))} EXPECTED 5")
+print(f"Rectangular conflicts in (0,4,1): {rect.count_conflicts((0, 4, 1))} EXPECTED 0")
+
+# incremental conflicts of the children must match a full count
+children = prob.child_conflicts((1,))
+print(f"Children of (1,): {children} EXPECTED {[prob.count_conflicts(child) for _, child, _ in prob.get_successors((1,))]}")
+even_children = even_torus.child_conflicts((0, 1))
+print(f"Toroidal children of (0,1): {even_children} EXPECTED {[even_torus.count_conflicts(child) for _, child, _ in even_torus.get_successors((0, 1))]}")
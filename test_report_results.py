@@ -0,0 +1,72 @@
+import os
+import tempfile
+from src.results_sink import ResultsSink, columnar_available
+from experiments import report_results
+
+COLUMNS = ["ALG", "HEURISTIC", "N", "TIME_TAKEN", "NODES_EXPANDED"]
+KEY = ["ALG", "HEURISTIC", "N"]
+
+def write_rows(path, n_values, time_taken, resume=False, fmt="csv"):
+    with ResultsSink(path, COLUMNS, KEY, fmt=fmt, resume=resume) as sink:
+        for n in n_values:
+            sink.write({"ALG": "A*", "HEURISTIC": "h1", "N": n, "TIME_TAKEN": time_taken, "NODES_EXPANDED": 10})
+
+def mean_times(state, fmt="csv"):
+    series = report_results.merged_series(state, "astar", fmt=fmt)
+    return {n: time_taken for n, time_taken, _ in series.get("h1", [])}
+
+def run_test():
+    print("=== TEST REPORT INCREMENTAL AGGREGATION ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "astar_results.csv")
+        report_results.SOURCES = {
+            "astar": (path, "HEURISTIC"),
+            "csp": (os.path.join(tmp, "csp_results.csv"), "ENCODING"),
+        }
+
+        write_rows(path, range(4, 8), 1.0)
+        state = report_results.update_aggregates({})
+        print(f"  first run:   {mean_times(state)}")
+        assert mean_times(state) == {4: 1.0, 5: 1.0, 6: 1.0, 7: 1.0}
+
+        # appended rows (resume) are folded in, old ones are not read again
+        write_rows(path, range(8, 10), 2.0, resume=True)
+        state = report_results.update_aggregates(state)
+        print(f"  after resume: {mean_times(state)}")
+        assert mean_times(state) == {4: 1.0, 5: 1.0, 6: 1.0, 7: 1.0, 8: 2.0, 9: 2.0}
+
+        # rewritten from scratch (no resume), same header and a longer file: aggregates are rebuilt
+        write_rows(path, range(4, 11), 5.0)
+        state = report_results.update_aggregates(state)
+        print(f"  after rewrite: {mean_times(state)}")
+        assert mean_times(state) == {n: 5.0 for n in range(4, 11)}
+
+        # a parquet run next to the old CSV: only the file of the chosen format is plotted
+        parquet_path = os.path.join(tmp, "astar_results.parquet")
+        if columnar_available():
+            write_rows(path, range(4, 6), 7.0, fmt="parquet")
+            state = report_results.update_aggregates(state, fmt="parquet")
+            print(f"  parquet next to csv: {mean_times(state, fmt='parquet')}")
+            assert mean_times(state, fmt="parquet") == {4: 7.0, 5: 7.0}
+        else:
+            # no pyarrow to write parts: the aggregates of an earlier parquet run stand in for them
+            os.makedirs(parquet_path)
+            state["astar_results.parquet"] = {"generation": "g", "parts": ["part-000000.parquet"],
+                                              "aggregates": {"h1": {"4": [1, 7.0, 10.0]}}}
+        state = report_results.update_aggregates(state)
+        print(f"  csv next to parquet: {mean_times(state)}")
+        assert "astar_results.parquet" in state
+        assert mean_times(state) == {n: 5.0 for n in range(4, 11)}
+
+        # a deleted results file is no longer plotted
+        os.remove(path)
+        state = report_results.update_aggregates(state)
+        print(f"  after delete: {mean_times(state)}")
+        assert mean_times(state) == {}
+        assert "astar_results.csv" not in state
+
+    print("\nReport aggregation: OK")
+
+if __name__ == "__main__":
+    run_test()
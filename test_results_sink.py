@@ -0,0 +1,64 @@
+import os
+import tempfile
+from src.results_sink import ResultsSink
+
+COLUMNS = ["ALG", "HEURISTIC", "N", "TIME_TAKEN"]
+KEY = ["ALG", "HEURISTIC", "N"]
+
+def run_test():
+    print("=== TEST RESULTS SINK ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.csv")
+
+        with ResultsSink(path, COLUMNS, KEY, batch_size=2, csv_formats={"TIME_TAKEN": "{:.3f}"}) as sink:
+            for n in range(4, 9):
+                sink.write({"ALG": "A*", "HEURISTIC": "h1", "N": n, "TIME_TAKEN": n / 10})
+
+                # rows hit the disk in batches, not one by one
+                with open(path) as f:
+                    print(f"  after N = {n}: {len(f.readlines()) - 1} rows on disk")
+
+        # simulating a crash in the middle of a row
+        with open(path, "a") as f:
+            f.write("A*,h1,9,0.")
+
+        sink = ResultsSink(path, COLUMNS, KEY, resume=True)
+        assert sink.is_done(("A*", "h1", 8))
+        assert not sink.is_done(("A*", "h1", 9))
+        assert sink.completed_row(("A*", "h1", 5))["TIME_TAKEN"] == "0.500"
+        sink.write({"ALG": "A*", "HEURISTIC": "h1", "N": 9, "TIME_TAKEN": 0.9})
+        sink.close()
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        print(f"  after resume: {lines}")
+        assert lines[0] == ",".join(COLUMNS)
+        assert lines[-1] == "A*,h1,9,0.9"
+        assert len(lines) == 7
+
+        # resuming with a different column list is refused, the file is left untouched
+        try:
+            ResultsSink(path, ["ALG", "N", "HEURISTIC", "TIME_TAKEN"], KEY, resume=True)
+            assert False, "resume with mismatching columns must fail"
+        except ValueError as e:
+            print(f"  mismatching columns: {e}")
+        with open(path) as f:
+            assert len(f.read().splitlines()) == 7
+
+        # with max_delay_s, slow rows don't wait for a full batch
+        timed_path = os.path.join(tmp, "timed.csv")
+        with ResultsSink(timed_path, COLUMNS, KEY, batch_size=32, max_delay_s=0) as sink:
+            sink.write({"ALG": "A*", "HEURISTIC": "h1", "N": 4, "TIME_TAKEN": 0.4})
+            with open(timed_path) as f:
+                assert len(f.read().splitlines()) == 2
+
+        # without resume the results are rewritten from scratch
+        ResultsSink(path, COLUMNS, KEY).close()
+        with open(path) as f:
+            assert f.read().splitlines() == [",".join(COLUMNS)]
+
+    print("\nResults sink: OK")
+
+if __name__ == "__main__":
+    run_test()